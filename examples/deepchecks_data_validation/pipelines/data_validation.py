@@ -27,7 +27,14 @@ docker_settings = DockerSettings(required_integrations=[DEEPCHECKS, SKLEARN])
 
 @pipeline(enable_cache=False, settings={"docker": docker_settings})
 def data_validation_pipeline():
-    """Links all the steps together in a pipeline."""
+    """Links all the steps together in a pipeline.
+
+    The data integrity and data drift checks only depend on the datasets, so
+    they don't have to wait for the model to be trained. Orchestrators that
+    run independent steps in parallel execute them alongside the trainer,
+    while the model validation and model drift checks run as soon as the
+    model is available.
+    """
     df_train, df_test = data_loader()
     data_validator(dataset=df_train)
     data_drift_detector(
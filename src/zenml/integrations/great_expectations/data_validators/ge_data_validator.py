@@ -13,28 +13,23 @@
 #  permissions and limitations under the License.
 """Implementation of the Great Expectations data validator."""
 
+import json
 import os
-from typing import Any, ClassVar, Dict, List, Optional, Sequence, Type, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    cast,
+)
 
-import pandas as pd
 import yaml
-from great_expectations.checkpoint.types.checkpoint_result import (  # type: ignore[import]
-    CheckpointResult,
-)
-from great_expectations.core import ExpectationSuite  # type: ignore[import]
-from great_expectations.data_context.data_context import (  # type: ignore[import]
-    BaseDataContext,
-    DataContext,
-)
-from great_expectations.data_context.types.base import (  # type: ignore[import]
-    DataContextConfig,
-)
-from great_expectations.data_context.types.resource_identifiers import (  # type: ignore[import]
-    ExpectationSuiteIdentifier,
-)
-from great_expectations.profile.user_configurable_profiler import (  # type: ignore[import]
-    UserConfigurableProfiler,
-)
 
 from zenml.client import Client
 from zenml.data_validators import BaseDataValidator, BaseDataValidatorFlavor
@@ -43,18 +38,41 @@ from zenml.integrations.great_expectations.flavors.great_expectations_data_valid
     GreatExpectationsDataValidatorConfig,
     GreatExpectationsDataValidatorFlavor,
 )
-from zenml.integrations.great_expectations.ge_store_backend import (
-    ZenMLArtifactStoreBackend,
-)
-from zenml.integrations.great_expectations.utils import create_batch_request
-from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.steps import STEP_ENVIRONMENT_NAME, StepEnvironment
 from zenml.utils import io_utils
 from zenml.utils.string_utils import random_str
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from great_expectations.checkpoint.types.checkpoint_result import (  # type: ignore[import]
+        CheckpointResult,
+    )
+    from great_expectations.core import (  # type: ignore[import]
+        ExpectationSuite,
+    )
+    from great_expectations.data_context.data_context import (  # type: ignore[import]
+        BaseDataContext,
+    )
+
+    from zenml.artifact_stores import BaseArtifactStore
+
+try:
+    # use the libyaml-based parser, if available
+    from yaml import CSafeLoader as YAMLSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLSafeLoader  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+# Expectation suite metadata key under which the fingerprint of the dataset and
+# profiler arguments used to infer the suite is stored.
+DATASET_FINGERPRINT_META_KEY = "zenml_dataset_fingerprint"
+
+# Process-level cache of Great Expectations data contexts, keyed by the data
+# validator ID, its configuration and the active artifact store ID.
+_DATA_CONTEXT_CACHE: Dict[Tuple[str, str, str], "BaseDataContext"] = {}
+
 
 class GreatExpectationsDataValidator(BaseDataValidator):
     """Great Expectations data validator stack component."""
@@ -64,8 +82,9 @@ class GreatExpectationsDataValidator(BaseDataValidator):
         Type[BaseDataValidatorFlavor]
     ] = GreatExpectationsDataValidatorFlavor
 
-    _context: BaseDataContext = None
+    _context: Optional["BaseDataContext"] = None
     _context_config: Optional[Dict[str, Any]] = None
+    _root_directory: Optional[str] = None
 
     @property
     def config(self) -> GreatExpectationsDataValidatorConfig:
@@ -77,7 +96,7 @@ class GreatExpectationsDataValidator(BaseDataValidator):
         return cast(GreatExpectationsDataValidatorConfig, self._config)
 
     @classmethod
-    def get_data_context(cls) -> BaseDataContext:
+    def get_data_context(cls) -> "BaseDataContext":
         """Get the Great Expectations data context managed by ZenML.
 
         Call this method to retrieve the data context managed by ZenML
@@ -118,16 +137,33 @@ class GreatExpectationsDataValidator(BaseDataValidator):
             self._context_config = context_config
             return self._context_config
 
-        # If the context config is a string, try to parse it as JSON/YAML
-        try:
-            context_config_dict = yaml.safe_load(context_config)
-        except yaml.parser.ParserError as e:
-            raise ValueError(
-                f"Malformed `context_config` value. Only JSON and YAML "
-                f"formats are supported: {str(e)}"
-            )
+        # If the context config is a string, try to parse it as JSON/YAML.
+        # JSON is a subset of YAML, but parsing it as JSON is much faster.
+        context_config_dict = None
+        if context_config.lstrip().startswith("{"):
+            try:
+                context_config_dict = json.loads(context_config)
+            except ValueError:
+                pass
+        if context_config_dict is None:
+            try:
+                context_config_dict = yaml.load(
+                    context_config, Loader=YAMLSafeLoader
+                )
+            except yaml.parser.ParserError as e:
+                raise ValueError(
+                    f"Malformed `context_config` value. Only JSON and YAML "
+                    f"formats are supported: {str(e)}"
+                )
 
         # Validate that the context config is a valid GE config
+        from great_expectations.data_context.data_context import (
+            BaseDataContext,
+        )
+        from great_expectations.data_context.types.base import (  # type: ignore[import]
+            DataContextConfig,
+        )
+
         try:
             context_config = DataContextConfig(**context_config_dict)
             BaseDataContext(project_config=context_config)
@@ -160,6 +196,10 @@ class GreatExpectationsDataValidator(BaseDataValidator):
         Returns:
             A dictionary with the GE store configuration.
         """
+        from zenml.integrations.great_expectations.ge_store_backend import (
+            ZenMLArtifactStoreBackend,
+        )
+
         return {
             "class_name": class_name,
             "store_backend": {
@@ -181,6 +221,10 @@ class GreatExpectationsDataValidator(BaseDataValidator):
         Returns:
             A dictionary with the GE data docs site configuration.
         """
+        from zenml.integrations.great_expectations.ge_store_backend import (
+            ZenMLArtifactStoreBackend,
+        )
+
         if local:
             store_backend = {
                 "class_name": "TupleFilesystemStoreBackend",
@@ -201,126 +245,168 @@ class GreatExpectationsDataValidator(BaseDataValidator):
             },
         }
 
+    @classmethod
+    def invalidate_context(cls) -> None:
+        """Invalidate the cached Great Expectations data contexts.
+
+        Data contexts are cached at process level and re-used by all data
+        validator instances that share the same ID, configuration and
+        artifact store. Call this method to force the data context to be
+        re-created the next time it is accessed by a new data validator
+        instance, e.g. after the local GE configuration files were modified.
+        """
+        _DATA_CONTEXT_CACHE.clear()
+
     @property
-    def data_context(self) -> BaseDataContext:
+    def data_context(self) -> "BaseDataContext":
         """Returns the Great Expectations data context configured for this component.
 
+        The data context is only created once per process for a given data
+        validator configuration and re-used afterwards.
+
         Returns:
             The Great Expectations data context configured for this component.
         """
         if not self._context:
-            expectations_store_name = "zenml_expectations_store"
-            validations_store_name = "zenml_validations_store"
-            checkpoint_store_name = "zenml_checkpoint_store"
-            profiler_store_name = "zenml_profiler_store"
-            evaluation_parameter_store_name = "evaluation_parameter_store"
-
-            zenml_context_config = dict(
-                stores={
-                    expectations_store_name: self.get_store_config(
-                        "ExpectationsStore", "expectations"
-                    ),
-                    validations_store_name: self.get_store_config(
-                        "ValidationsStore", "validations"
-                    ),
-                    checkpoint_store_name: self.get_store_config(
-                        "CheckpointStore", "checkpoints"
-                    ),
-                    profiler_store_name: self.get_store_config(
-                        "ProfilerStore", "profilers"
-                    ),
-                    evaluation_parameter_store_name: {
-                        "class_name": "EvaluationParameterStore"
-                    },
-                },
-                expectations_store_name=expectations_store_name,
-                validations_store_name=validations_store_name,
-                checkpoint_store_name=checkpoint_store_name,
-                profiler_store_name=profiler_store_name,
-                evaluation_parameter_store_name=evaluation_parameter_store_name,
-                data_docs_sites={
-                    "zenml_artifact_store": self.get_data_docs_config(
-                        "data_docs"
-                    )
-                },
+            artifact_store = Client().active_stack.artifact_store
+            cache_key = (
+                str(self.id),
+                self.config.json(sort_keys=True),
+                str(artifact_store.id),
             )
+            context = _DATA_CONTEXT_CACHE.get(cache_key)
+            if context is None:
+                context = self._create_data_context(artifact_store)
+                _DATA_CONTEXT_CACHE[cache_key] = context
+            self._context = context
+
+        return self._context
+
+    def _create_data_context(
+        self, artifact_store: "BaseArtifactStore"
+    ) -> "BaseDataContext":
+        """Create the Great Expectations data context configured for this component.
+
+        Args:
+            artifact_store: The active artifact store.
+
+        Returns:
+            The Great Expectations data context configured for this component.
+        """
+        from great_expectations.data_context.data_context import (
+            BaseDataContext,
+            DataContext,
+        )
+        from great_expectations.data_context.types.base import (
+            DataContextConfig,
+        )
+
+        expectations_store_name = "zenml_expectations_store"
+        validations_store_name = "zenml_validations_store"
+        checkpoint_store_name = "zenml_checkpoint_store"
+        profiler_store_name = "zenml_profiler_store"
+        evaluation_parameter_store_name = "evaluation_parameter_store"
+
+        zenml_context_config = dict(
+            stores={
+                expectations_store_name: self.get_store_config(
+                    "ExpectationsStore", "expectations"
+                ),
+                validations_store_name: self.get_store_config(
+                    "ValidationsStore", "validations"
+                ),
+                checkpoint_store_name: self.get_store_config(
+                    "CheckpointStore", "checkpoints"
+                ),
+                profiler_store_name: self.get_store_config(
+                    "ProfilerStore", "profilers"
+                ),
+                evaluation_parameter_store_name: {
+                    "class_name": "EvaluationParameterStore"
+                },
+            },
+            expectations_store_name=expectations_store_name,
+            validations_store_name=validations_store_name,
+            checkpoint_store_name=checkpoint_store_name,
+            profiler_store_name=profiler_store_name,
+            evaluation_parameter_store_name=evaluation_parameter_store_name,
+            data_docs_sites={
+                "zenml_artifact_store": self.get_data_docs_config("data_docs")
+            },
+        )
 
-            configure_zenml_stores = self.config.configure_zenml_stores
-            if self.config.context_root_dir:
-                # initialize the local data context, if a local path was
-                # configured
-                self._context = DataContext(self.config.context_root_dir)
+        # the ZenML stores only need to be added after initialization if the
+        # context is not created from the ZenML configuration below, where
+        # they are already baked in
+        configure_zenml_stores = self.config.configure_zenml_stores and bool(
+            self.config.context_root_dir or self.context_config
+        )
+        if self.config.context_root_dir:
+            # initialize the local data context, if a local path was
+            # configured
+            context = DataContext(self.config.context_root_dir)
+        else:
+            # create an in-memory data context configuration that is not
+            # backed by a local YAML file (see https://docs.greatexpectations.io/docs/guides/setup/configuring_data_contexts/how_to_instantiate_a_data_context_without_a_yml_file/).
+            if self.context_config:
+                context_config = DataContextConfig(**self.context_config)
             else:
-                # create an in-memory data context configuration that is not
-                # backed by a local YAML file (see https://docs.greatexpectations.io/docs/guides/setup/configuring_data_contexts/how_to_instantiate_a_data_context_without_a_yml_file/).
-                if self.context_config:
-                    context_config = DataContextConfig(**self.context_config)
-                else:
-                    context_config = DataContextConfig(**zenml_context_config)
-                    # skip adding the stores after initialization, as they are
-                    # already baked in the initial configuration
-                    configure_zenml_stores = False
-                self._context = BaseDataContext(project_config=context_config)
-
-            if configure_zenml_stores:
-                self._context.config.expectations_store_name = (
-                    expectations_store_name
-                )
-                self._context.config.validations_store_name = (
-                    validations_store_name
-                )
-                self._context.config.checkpoint_store_name = (
-                    checkpoint_store_name
-                )
-                self._context.config.profiler_store_name = profiler_store_name
-                self._context.config.evaluation_parameter_store_name = (
-                    evaluation_parameter_store_name
+                context_config = DataContextConfig(**zenml_context_config)
+            context = BaseDataContext(project_config=context_config)
+
+        if configure_zenml_stores:
+            context.config.expectations_store_name = expectations_store_name
+            context.config.validations_store_name = validations_store_name
+            context.config.checkpoint_store_name = checkpoint_store_name
+            context.config.profiler_store_name = profiler_store_name
+            context.config.evaluation_parameter_store_name = (
+                evaluation_parameter_store_name
+            )
+            for store_name, store_config in zenml_context_config[  # type: ignore[attr-defined]
+                "stores"
+            ].items():
+                context.add_store(
+                    store_name=store_name,
+                    store_config=store_config,
                 )
-                for store_name, store_config in zenml_context_config[  # type: ignore[attr-defined]
-                    "stores"
-                ].items():
-                    self._context.add_store(
-                        store_name=store_name,
-                        store_config=store_config,
-                    )
-                for site_name, site_config in zenml_context_config[  # type: ignore[attr-defined]
-                    "data_docs_sites"
-                ].items():
-                    self._context.config.data_docs_sites[
-                        site_name
-                    ] = site_config
-
-            if self.config.configure_local_docs:
-                client = Client()
-                artifact_store = client.active_stack.artifact_store
-                if artifact_store.flavor != "local":
-                    self._context.config.data_docs_sites[
-                        "zenml_local"
-                    ] = self.get_data_docs_config("data_docs", local=True)
+            for site_name, site_config in zenml_context_config[  # type: ignore[attr-defined]
+                "data_docs_sites"
+            ].items():
+                context.config.data_docs_sites[site_name] = site_config
+
+        if (
+            self.config.configure_local_docs
+            and artifact_store.flavor != "local"
+        ):
+            context.config.data_docs_sites[
+                "zenml_local"
+            ] = self.get_data_docs_config("data_docs", local=True)
 
-        return self._context
+        return context
 
     @property
     def root_directory(self) -> str:
         """Returns path to the root directory for all local files concerning this data validator.
 
+        The directory is created the first time this property is accessed.
+
         Returns:
             Path to the root directory.
         """
-        path = os.path.join(
-            io_utils.get_global_config_directory(),
-            self.flavor,
-            str(self.id),
-        )
-
-        if not os.path.exists(path):
-            fileio.makedirs(path)
+        if self._root_directory is None:
+            path = os.path.join(
+                io_utils.get_global_config_directory(),
+                self.flavor,
+                str(self.id),
+            )
+            os.makedirs(path, exist_ok=True)
+            self._root_directory = path
 
-        return path
+        return self._root_directory
 
     def data_profiling(
         self,
-        dataset: pd.DataFrame,
+        dataset: "pd.DataFrame",
         comparison_dataset: Optional[Any] = None,
         profile_list: Optional[Sequence[str]] = None,
         expectation_suite_name: Optional[str] = None,
@@ -328,7 +414,7 @@ class GreatExpectationsDataValidator(BaseDataValidator):
         profiler_kwargs: Optional[Dict[str, Any]] = None,
         overwrite_existing_suite: bool = True,
         **kwargs: Any,
-    ) -> ExpectationSuite:
+    ) -> "ExpectationSuite":
         """Infer a Great Expectation Expectation Suite from a given dataset.
 
         This Great Expectations specific data profiling method implementation
@@ -354,7 +440,9 @@ class GreatExpectationsDataValidator(BaseDataValidator):
             profiler_kwargs: A dictionary of custom keyword arguments to pass to
                 the profiler.
             overwrite_existing_suite: Whether to overwrite an existing
-                expectation suite, if one exists with that name.
+                expectation suite, if one exists with that name. The profiler
+                is not re-run if the existing suite was inferred from an
+                identical dataset using the same profiler arguments.
             kwargs: Additional keyword arguments (unused).
 
         Returns:
@@ -365,7 +453,21 @@ class GreatExpectationsDataValidator(BaseDataValidator):
                 a name for the expectation suite cannot be generated from the
                 current step name and pipeline name.
         """
+        from great_expectations.exceptions import (  # type: ignore[import]
+            DataContextError,
+        )
+        from great_expectations.profile.user_configurable_profiler import (  # type: ignore[import]
+            UserConfigurableProfiler,
+        )
+
+        from zenml.integrations.great_expectations.utils import (
+            create_batch_request,
+            get_dataset_fingerprint,
+            release_batch_request,
+        )
+
         context = self.data_context
+        profiler_kwargs = profiler_kwargs or {}
 
         if comparison_dataset is not None:
             logger.warning(
@@ -388,28 +490,42 @@ class GreatExpectationsDataValidator(BaseDataValidator):
                     "the context of a pipeline step."
                 )
 
-        suite_exists = False
-        if context.expectations_store.has_key(  # noqa
-            ExpectationSuiteIdentifier(expectation_suite_name)
-        ):
-            suite_exists = True
+        # fetch the existing suite, if any, in a single store lookup and
+        # re-use it below instead of fetching it again from the store
+        try:
             suite = context.get_expectation_suite(expectation_suite_name)
-            if not overwrite_existing_suite:
-                logger.info(
-                    f"Expectation Suite `{expectation_suite_name}` "
-                    f"already exists and `overwrite_existing_suite` is not set "
-                    f"in the step configuration. Skipping re-running the "
-                    f"profiler."
-                )
-                return suite
+        except DataContextError:
+            suite = None
+
+        if suite is not None and not overwrite_existing_suite:
+            logger.info(
+                f"Expectation Suite `{expectation_suite_name}` "
+                f"already exists and `overwrite_existing_suite` is not set "
+                f"in the step configuration. Skipping re-running the "
+                f"profiler."
+            )
+            return suite
+
+        fingerprint = get_dataset_fingerprint(dataset, profiler_kwargs)
+        if (
+            fingerprint is not None
+            and suite is not None
+            and suite.meta.get(DATASET_FINGERPRINT_META_KEY) == fingerprint
+        ):
+            logger.info(
+                f"Expectation Suite `{expectation_suite_name}` was already "
+                f"inferred from an identical dataset using the same profiler "
+                f"arguments. Skipping re-running the profiler."
+            )
+            return suite
 
         batch_request = create_batch_request(context, dataset, data_asset_name)
 
         try:
-            if suite_exists:
+            if suite is not None:
                 validator = context.get_validator(
                     batch_request=batch_request,
-                    expectation_suite_name=expectation_suite_name,
+                    expectation_suite=suite,
                 )
             else:
                 validator = context.get_validator(
@@ -422,6 +538,11 @@ class GreatExpectationsDataValidator(BaseDataValidator):
             )
 
             suite = profiler.build_suite()
+            if fingerprint is not None:
+                suite.meta[DATASET_FINGERPRINT_META_KEY] = fingerprint
+            else:
+                # don't keep the fingerprint of a previously profiled dataset
+                suite.meta.pop(DATASET_FINGERPRINT_META_KEY, None)
             context.save_expectation_suite(
                 expectation_suite=suite,
                 expectation_suite_name=expectation_suite_name,
@@ -429,20 +550,21 @@ class GreatExpectationsDataValidator(BaseDataValidator):
 
             context.build_data_docs()
         finally:
-            context.delete_datasource(batch_request.datasource_name)
+            release_batch_request(context, batch_request)
 
         return suite
 
     def data_validation(
         self,
-        dataset: pd.DataFrame,
+        dataset: "pd.DataFrame",
         comparison_dataset: Optional[Any] = None,
         check_list: Optional[Sequence[str]] = None,
         expectation_suite_name: Optional[str] = None,
         data_asset_name: Optional[str] = None,
         action_list: Optional[List[Dict[str, Any]]] = None,
+        persist_checkpoint: bool = False,
         **kwargs: Any,
-    ) -> CheckpointResult:
+    ) -> "CheckpointResult":
         """Great Expectations data validation.
 
         This Great Expectations specific data validation method
@@ -464,6 +586,9 @@ class GreatExpectationsDataValidator(BaseDataValidator):
                 dataset in the Great Expectations docs.
             action_list: A list of additional Great Expectations actions to run after
                 the validation check.
+            persist_checkpoint: Whether to save the validation checkpoint in
+                the Great Expectations checkpoint store. By default, the
+                checkpoint is only created in memory.
             kwargs: Additional keyword arguments (unused).
 
         Returns:
@@ -481,6 +606,74 @@ class GreatExpectationsDataValidator(BaseDataValidator):
                 "to do data validation. Silently ignoring the supplied dataset "
             )
 
+        return self.data_validation_many(
+            validations=[(dataset, expectation_suite_name, data_asset_name)],
+            action_list=action_list,
+            parallel=False,
+            persist_checkpoint=persist_checkpoint,
+        )[0]
+
+    def data_validation_many(
+        self,
+        validations: Sequence[Tuple["pd.DataFrame", str, Optional[str]]],
+        action_list: Optional[List[Dict[str, Any]]] = None,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        persist_checkpoint: bool = False,
+    ) -> List["CheckpointResult"]:
+        """Validate multiple datasets against Expectation Suites.
+
+        The validations are independent of each other: a separate runtime
+        datasource and checkpoint is used for every one of them and, if
+        `parallel` is set, the checkpoints are run concurrently in a thread
+        pool, unless GE usage statistics are enabled for the data context:
+        these aren't thread-safe, so the checkpoints are run sequentially in
+        that case. Data docs are not updated concurrently: when running in
+        parallel, any `UpdateDataDocsAction` is skipped for the individual
+        checkpoints and the data docs are built once after all of them
+        have finished.
+
+        Args:
+            validations: A sequence of `(dataset, expectation_suite_name,
+                data_asset_name)` tuples identifying the datasets to validate,
+                the names of the expectation suites to validate them against
+                and the optional names of the data assets used to identify the
+                datasets in the Great Expectations docs.
+            action_list: A list of additional Great Expectations actions to run
+                after each validation check.
+            parallel: Whether to run the validation checkpoints concurrently.
+                The checkpoints share the same data context, so this should
+                only be enabled for actions that are safe to run
+                concurrently.
+            max_workers: The maximum number of threads used to run the
+                validation checkpoints concurrently. Defaults to one thread
+                per validation.
+            persist_checkpoint: Whether to save the validation checkpoints in
+                the Great Expectations checkpoint store. By default, the
+                checkpoints are only created in memory.
+
+        Returns:
+            The Great Expectations validation (checkpoint) results, in the same
+            order as the supplied validations.
+
+        Raises:
+            ValueError: if an expectation suite name is missing.
+        """
+        from great_expectations.checkpoint import (  # type: ignore[import]
+            Checkpoint,
+        )
+
+        from zenml.integrations.great_expectations.utils import (
+            create_batch_request,
+            release_batch_request,
+        )
+
+        for _, expectation_suite_name, _ in validations:
+            if not expectation_suite_name:
+                raise ValueError(
+                    "Missing expectation_suite_name argument value."
+                )
+
         try:
             # get pipeline name, step name and run id
             step_env = cast(
@@ -495,10 +688,6 @@ class GreatExpectationsDataValidator(BaseDataValidator):
 
         context = self.data_context
 
-        checkpoint_name = f"{run_name}_{step_name}"
-
-        batch_request = create_batch_request(context, dataset, data_asset_name)
-
         action_list = action_list or [
             {
                 "name": "store_validation_result",
@@ -514,23 +703,95 @@ class GreatExpectationsDataValidator(BaseDataValidator):
             },
         ]
 
-        checkpoint_config = {
-            "name": checkpoint_name,
-            "run_name_template": run_name,
-            "config_version": 1,
-            "class_name": "Checkpoint",
-            "expectation_suite_name": expectation_suite_name,
-            "action_list": action_list,
-        }
-        context.add_checkpoint(**checkpoint_config)
+        parallel = parallel and len(validations) > 1
+        if parallel and context.usage_statistics_handler is not None:
+            # GE usage statistics track the duration of every run as
+            # temporary attributes of a handler shared by the whole data
+            # context, which breaks when checkpoints run concurrently
+            logger.info(
+                "Great Expectations usage statistics are enabled for the "
+                "data context. Running the validation checkpoints "
+                "sequentially."
+            )
+            parallel = False
+        build_data_docs = False
+        if parallel:
+            # Building the data docs from multiple threads races on the
+            # same docs site, so it is done only once after the pool
+            checkpoint_action_list = [
+                action
+                for action in action_list
+                if action["action"].get("class_name") != "UpdateDataDocsAction"
+            ]
+            build_data_docs = len(checkpoint_action_list) < len(action_list)
+        else:
+            checkpoint_action_list = action_list
 
+        # The GE datasource and checkpoint registries are not thread-safe, so
+        # all checkpoints are created upfront, under unique names
+        batch_requests: List[Any] = []
+        checkpoints: List[Tuple["Checkpoint", Any]] = []
         try:
-            results = context.run_checkpoint(
-                checkpoint_name=checkpoint_name,
-                validations=[{"batch_request": batch_request}],
-            )
+            for i, validation in enumerate(validations):
+                dataset, expectation_suite_name, data_asset_name = validation
+                checkpoint_name = f"{run_name}_{step_name}"
+                if len(validations) > 1:
+                    checkpoint_name = f"{checkpoint_name}_{i}"
+
+                batch_request = create_batch_request(
+                    context, dataset, data_asset_name
+                )
+                batch_requests.append(batch_request)
+
+                checkpoint_config = {
+                    "name": checkpoint_name,
+                    "run_name_template": run_name,
+                    "config_version": 1,
+                    "expectation_suite_name": expectation_suite_name,
+                    "action_list": checkpoint_action_list,
+                }
+                if persist_checkpoint:
+                    checkpoint = context.add_checkpoint(
+                        class_name="Checkpoint", **checkpoint_config
+                    )
+                else:
+                    # running an in-memory checkpoint avoids a round-trip
+                    # to the checkpoint store to save, load and delete it
+                    checkpoint = Checkpoint(
+                        data_context=context, **checkpoint_config
+                    )
+                checkpoints.append((checkpoint, batch_request))
+
+            def run_checkpoint(
+                checkpoint_and_batch_request: Tuple["Checkpoint", Any]
+            ) -> "CheckpointResult":
+                """Run a validation checkpoint.
+
+                Args:
+                    checkpoint_and_batch_request: The checkpoint to run and
+                        the batch request to validate.
+
+                Returns:
+                    The Great Expectations validation (checkpoint) result.
+                """
+                checkpoint, batch_request = checkpoint_and_batch_request
+                return checkpoint.run(
+                    validations=[{"batch_request": batch_request}],
+                )
+
+            if parallel:
+                with ThreadPoolExecutor(
+                    max_workers=max_workers or len(checkpoints)
+                ) as executor:
+                    results = list(executor.map(run_checkpoint, checkpoints))
+                if build_data_docs:
+                    context.build_data_docs()
+            else:
+                results = [
+                    run_checkpoint(checkpoint) for checkpoint in checkpoints
+                ]
         finally:
-            context.delete_datasource(batch_request.datasource_name)
-            context.delete_checkpoint(checkpoint_name)
+            for batch_request in batch_requests:
+                release_batch_request(context, batch_request)
 
         return results
@@ -129,11 +129,11 @@ class ZenMLArtifactStoreBackend(TupleStoreBackend):  # type: ignore[misc]
             str: the object's contents
         """
         filepath: str = self._build_object_path(key)
-        if fileio.exists(filepath):
+        try:
             contents = io_utils.read_file_contents_as_string(filepath).rstrip(
                 "\n"
             )
-        else:
+        except FileNotFoundError:
             raise InvalidKeyError(
                 f"Unable to retrieve object from {self.__class__.__name__} with "
                 f"the following Key: {str(filepath)}"
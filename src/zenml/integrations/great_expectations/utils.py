@@ -13,7 +13,11 @@
 #  permissions and limitations under the License.
 """Great Expectations data profiling standard step."""
 
-from typing import Optional, cast
+import hashlib
+import json
+import threading
+from typing import Any, Dict, List, Optional, cast
+from weakref import WeakKeyDictionary
 
 import pandas as pd
 from great_expectations.core.batch import (  # type: ignore[import]
@@ -30,40 +34,51 @@ from zenml.utils.string_utils import random_str
 
 logger = get_logger(__name__)
 
+RUNTIME_DATASOURCE_NAME_PREFIX = "zenml_runtime_datasource"
+RUNTIME_DATA_CONNECTOR_NAME = "zenml_runtime_data_connector"
+RUNTIME_BATCH_IDENTIFIER = "default"
+
+
+class _DatasourcePool:
+    """Runtime datasources registered by ZenML in a GE data context."""
+
+    def __init__(self) -> None:
+        """Create an empty datasource pool."""
+        self.size = 0
+        self.free: List[str] = []
+
+
+# Runtime datasources are registered once per data context and re-used across
+# batch requests, instead of being added and deleted for every batch request.
+_datasource_pool: "WeakKeyDictionary[BaseDataContext, _DatasourcePool]" = (
+    WeakKeyDictionary()
+)
+_datasource_pool_lock = threading.Lock()
 
-def create_batch_request(
-    context: BaseDataContext,
-    dataset: pd.DataFrame,
-    data_asset_name: Optional[str],
-) -> RuntimeBatchRequest:
-    """Create a temporary runtime GE batch request from a dataset step artifact.
+
+def _is_file_backed(context: BaseDataContext) -> bool:
+    """Check whether a data context persists its configuration to disk.
 
     Args:
         context: Great Expectations data context.
-        dataset: Input dataset.
-        data_asset_name: Optional custom name for the data asset.
 
     Returns:
-        A Great Expectations runtime batch request.
+        True if the context saves its configuration (including the
+        registered datasources) to a `great_expectations.yml` file.
     """
-    try:
-        # get pipeline name, step name and run id
-        step_env = cast(StepEnvironment, Environment()[STEP_ENVIRONMENT_NAME])
-        pipeline_name = step_env.pipeline_name
-        run_name = step_env.run_name
-        step_name = step_env.step_name
-    except KeyError:
-        # if not running inside a pipeline step, use random values
-        pipeline_name = f"pipeline_{random_str(5)}"
-        run_name = f"pipeline_{random_str(5)}"
-        step_name = f"step_{random_str(5)}"
-
-    datasource_name = f"{run_name}_{step_name}"
-    data_connector_name = datasource_name
-    data_asset_name = data_asset_name or f"{pipeline_name}_{step_name}"
-    batch_identifier = "default"
-
-    datasource_config = {
+    return getattr(context, "root_directory", None) is not None
+
+
+def _get_datasource_config(datasource_name: str) -> Dict[str, Any]:
+    """Get the configuration of a ZenML runtime datasource.
+
+    Args:
+        datasource_name: The name of the datasource.
+
+    Returns:
+        The datasource configuration.
+    """
+    return {
         "name": datasource_name,
         "class_name": "Datasource",
         "module_name": "great_expectations.datasource",
@@ -72,20 +87,241 @@ def create_batch_request(
             "class_name": "PandasExecutionEngine",
         },
         "data_connectors": {
-            data_connector_name: {
+            RUNTIME_DATA_CONNECTOR_NAME: {
                 "class_name": "RuntimeDataConnector",
-                "batch_identifiers": [batch_identifier],
+                "batch_identifiers": [RUNTIME_BATCH_IDENTIFIER],
             },
         },
     }
 
-    context.add_datasource(**datasource_config)
+
+def _acquire_datasource(context: BaseDataContext) -> str:
+    """Get a runtime datasource that is not in use from the context pool.
+
+    A new datasource is registered in the data context only if all the
+    datasources already registered by ZenML are in use. File-backed data
+    contexts would persist pooled datasources in their configuration file,
+    so a new datasource is registered for every call instead.
+
+    Args:
+        context: Great Expectations data context.
+
+    Returns:
+        The name of the acquired datasource.
+    """
+    if _is_file_backed(context):
+        datasource_name = f"{RUNTIME_DATASOURCE_NAME_PREFIX}_{random_str(8)}"
+        context.add_datasource(**_get_datasource_config(datasource_name))
+        return datasource_name
+
+    with _datasource_pool_lock:
+        pool = _datasource_pool.setdefault(context, _DatasourcePool())
+        if pool.free:
+            return pool.free.pop()
+
+        datasource_name = f"{RUNTIME_DATASOURCE_NAME_PREFIX}_{pool.size}"
+        pool.size += 1
+        context.add_datasource(**_get_datasource_config(datasource_name))
+        return datasource_name
+
+
+def create_batch_request(
+    context: BaseDataContext,
+    dataset: pd.DataFrame,
+    data_asset_name: Optional[str],
+) -> RuntimeBatchRequest:
+    """Create a temporary runtime GE batch request from a dataset step artifact.
+
+    The batch request uses one of the runtime datasources that ZenML keeps
+    registered in the data context. Call `release_batch_request` when the
+    batch request is no longer needed to make the datasource available for
+    other batch requests.
+
+    Args:
+        context: Great Expectations data context.
+        dataset: Input dataset.
+        data_asset_name: Optional custom name for the data asset.
+
+    Returns:
+        A Great Expectations runtime batch request.
+    """
+    if not data_asset_name:
+        try:
+            # get pipeline name and step name
+            step_env = cast(
+                StepEnvironment, Environment()[STEP_ENVIRONMENT_NAME]
+            )
+            pipeline_name = step_env.pipeline_name
+            step_name = step_env.step_name
+        except KeyError:
+            # if not running inside a pipeline step, use random values
+            pipeline_name = f"pipeline_{random_str(5)}"
+            step_name = f"step_{random_str(5)}"
+        data_asset_name = f"{pipeline_name}_{step_name}"
+
     batch_request = RuntimeBatchRequest(
-        datasource_name=datasource_name,
-        data_connector_name=data_connector_name,
+        datasource_name=_acquire_datasource(context),
+        data_connector_name=RUNTIME_DATA_CONNECTOR_NAME,
         data_asset_name=data_asset_name,
         runtime_parameters={"batch_data": dataset},
-        batch_identifiers={batch_identifier: batch_identifier},
+        batch_identifiers={RUNTIME_BATCH_IDENTIFIER: RUNTIME_BATCH_IDENTIFIER},
     )
 
     return batch_request
+
+
+def release_batch_request(
+    context: BaseDataContext,
+    batch_request: RuntimeBatchRequest,
+) -> None:
+    """Release the datasource used by a batch request created by ZenML.
+
+    The batch data loaded in the datasource execution engine is dropped and
+    the datasource is made available for other batch requests. Datasources
+    registered in file-backed data contexts are deleted instead.
+
+    Args:
+        context: Great Expectations data context.
+        batch_request: A batch request created with `create_batch_request`.
+    """
+    datasource_name = batch_request.datasource_name
+    if _is_file_backed(context):
+        context.delete_datasource(datasource_name)
+        return
+
+    try:
+        _clear_batch_data(context, datasource_name)
+    finally:
+        with _datasource_pool_lock:
+            _datasource_pool[context].free.append(datasource_name)
+
+
+def _clear_batch_data(context: BaseDataContext, datasource_name: str) -> None:
+    """Drop the batch data loaded in a datasource execution engine.
+
+    The batch data caches are not part of the public GE API, so failing to
+    clear them is only logged: the datasource can still be re-used, it only
+    holds on to the previous batch data for longer.
+
+    Args:
+        context: Great Expectations data context.
+        datasource_name: The name of the datasource.
+    """
+    try:
+        execution_engine = context.get_datasource(
+            datasource_name
+        ).execution_engine
+        batch_manager = getattr(execution_engine, "batch_manager", None)
+        if batch_manager is not None:
+            batch_manager.batch_data_cache.clear()
+            batch_manager.reset_batch_cache()
+        else:
+            # older GE versions keep the batch data in the execution engine
+            execution_engine.loaded_batch_data_dict.clear()
+    except Exception:
+        logger.debug(
+            f"Failed to clear the batch data of datasource "
+            f"`{datasource_name}`.",
+            exc_info=True,
+        )
+
+
+def _hash_dataset_contents(dataset: pd.DataFrame) -> Optional[bytes]:
+    """Hash the contents of a dataset, including its index.
+
+    If `pyarrow` and `xxhash` are installed, the dataset is converted to an
+    Arrow table and the column memory buffers are hashed in bulk, which is
+    considerably faster for large datasets than hashing every cell. Otherwise,
+    or if the dataset cannot be converted to Arrow, the pandas row hashes are
+    used instead.
+
+    Args:
+        dataset: Input dataset.
+
+    Returns:
+        The dataset contents hash or None if the dataset contents can't be
+        hashed (e.g. because of unhashable list or dict values).
+    """
+    try:
+        import pyarrow as pa  # type: ignore[import]
+        import xxhash  # type: ignore[import]
+    except ImportError:
+        pass
+    else:
+        try:
+            table = pa.Table.from_pandas(dataset, preserve_index=True)
+        except (
+            pa.ArrowInvalid,
+            pa.ArrowTypeError,
+            pa.ArrowNotImplementedError,
+            # e.g. raised by pyarrow for duplicate column names
+            ValueError,
+            TypeError,
+        ):
+            logger.debug(
+                "Failed to convert dataset to Arrow, falling back to pandas "
+                "hashing.",
+                exc_info=True,
+            )
+        else:
+            digest = xxhash.xxh3_128()
+            digest.update(table.schema.serialize())
+            for column in table.columns:
+                for chunk in column.chunks:
+                    arrays = [chunk]
+                    if pa.types.is_dictionary(chunk.type):
+                        arrays.append(chunk.dictionary)
+                    for array in arrays:
+                        # buffers may extend beyond the array slice
+                        digest.update(f"{array.offset}:{len(array)}".encode())
+                        for buffer in array.buffers():
+                            if buffer is not None:
+                                digest.update(buffer)
+            arrow_hash: bytes = digest.digest()
+            return b"arrow:" + arrow_hash
+
+    try:
+        row_hashes = pd.util.hash_pandas_object(dataset, index=True)
+    except TypeError:
+        logger.debug(
+            "Failed to hash the dataset contents.",
+            exc_info=True,
+        )
+        return None
+    pandas_hash: bytes = row_hashes.values.tobytes()
+    return b"pandas:" + pandas_hash
+
+
+def get_dataset_fingerprint(
+    dataset: pd.DataFrame,
+    profiler_kwargs: Optional[Dict[str, Any]] = None,
+) -> Optional[str]:
+    """Compute a stable fingerprint of a dataset and profiler arguments.
+
+    Args:
+        dataset: Input dataset.
+        profiler_kwargs: Optional keyword arguments passed to the profiler.
+
+    Returns:
+        A hex digest that only changes when the dataset contents (including
+        the index, column names and types) or the profiler arguments change,
+        or None if the dataset contents can't be hashed.
+    """
+    contents_hash = _hash_dataset_contents(dataset)
+    if contents_hash is None:
+        return None
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(contents_hash)
+    digest.update(
+        json.dumps(
+            [
+                (str(column), str(dtype))
+                for column, dtype in dataset.dtypes.items()
+            ]
+        ).encode()
+    )
+    digest.update(
+        json.dumps(profiler_kwargs or {}, sort_keys=True, default=str).encode()
+    )
+    return digest.hexdigest()
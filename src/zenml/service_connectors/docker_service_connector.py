@@ -16,13 +16,15 @@
 The Docker Service Connector is responsible for authenticating with a Docker
 (or compatible) registry.
 """
-import re
-import subprocess
-from typing import Any, List, Optional
+import functools
+import json
+import os
+import string
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from docker.client import DockerClient
-from docker.errors import DockerException
-from pydantic import Field, SecretStr
+from pydantic import Field, PrivateAttr, SecretStr
 
 from zenml.constants import DOCKER_REGISTRY_RESOURCE_TYPE
 from zenml.exceptions import AuthorizationException
@@ -38,6 +40,9 @@ from zenml.service_connectors.service_connector import (
 )
 from zenml.utils.enum_utils import StrEnum
 
+if TYPE_CHECKING:
+    from docker.client import DockerClient
+
 logger = get_logger(__name__)
 
 
@@ -64,6 +69,166 @@ class DockerConfiguration(DockerCredentials):
 DOCKER_CONNECTOR_TYPE = "docker"
 DOCKER_REGISTRY_NAME = "docker.io"
 
+# Characters allowed in the dot-separated labels of a Docker registry host
+_DOCKER_HOST_LABEL_CHARS = frozenset(
+    string.ascii_letters + string.digits + "-"
+)
+_DOCKER_PORT_CHARS = frozenset(string.digits)
+
+# How long (in seconds) a successful registry login performed by the cached
+# Docker client of a connector is reused before logging in again
+DOCKER_LOGIN_CACHE_TTL = 300
+
+# How long (in seconds) to wait for the Docker CLI or a Docker credential
+# helper to log in to a registry
+DOCKER_LOGIN_TIMEOUT = 60
+
+# The server URL under which the Docker CLI stores DockerHub credentials
+DOCKER_HUB_SERVER_URL = "https://index.docker.io/v1/"
+
+
+def _get_docker_config_path() -> str:
+    """Get the path of the local Docker client configuration file.
+
+    Returns:
+        The path of the Docker client configuration file.
+    """
+    config_dir = os.environ.get("DOCKER_CONFIG") or os.path.join(
+        os.path.expanduser("~"), ".docker"
+    )
+    return os.path.join(config_dir, "config.json")
+
+
+def _read_docker_config() -> Optional[Dict[str, Any]]:
+    """Read the local Docker client configuration.
+
+    Returns:
+        The Docker client configuration, an empty configuration if the file
+        doesn't exist yet or None if the file can't be read or parsed.
+    """
+    try:
+        with open(_get_docker_config_path(), "r") as f:
+            docker_config = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        return None
+
+    return docker_config if isinstance(docker_config, dict) else None
+
+
+def _run_with_secret_input(
+    command: List[str], secret: bytearray
+) -> Tuple[int, bytes]:
+    """Run a command that reads a secret from its standard input.
+
+    The secret buffer is zeroed as soon as the process consumed it, so the
+    plaintext isn't kept around longer than needed.
+
+    Args:
+        command: The command to run.
+        secret: The secret to pass to the command on standard input.
+
+    Returns:
+        The return code and standard error output of the command.
+
+    Raises:
+        TimeoutExpired: If the command didn't finish within
+            `DOCKER_LOGIN_TIMEOUT` seconds.
+    """
+    import subprocess
+
+    try:
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        try:
+            _, stderr = process.communicate(
+                input=secret, timeout=DOCKER_LOGIN_TIMEOUT
+            )
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
+    finally:
+        secret[:] = bytes(len(secret))
+
+    return process.returncode, stderr
+
+
+def _is_valid_docker_resource_id(resource_id: str) -> bool:
+    """Check whether a string is a Docker registry host or repository URL.
+
+    Accepted are an optional `http://` or `https://` scheme, followed by a
+    host made up of dot-separated labels, an optional port and an optional
+    path, e.g. `docker.io`, `https://index.docker.io/v1/` or
+    `http://localhost:5000/my-repo`.
+
+    Args:
+        resource_id: The resource ID to check.
+
+    Returns:
+        True if the resource ID is valid, False otherwise.
+    """
+    for scheme in ("https://", "http://"):
+        if resource_id.startswith(scheme):
+            resource_id = resource_id[len(scheme) :]
+            break
+
+    host, separator, path = resource_id.partition("/")
+    if separator and (not path or "\n" in path):
+        return False
+
+    host, separator, port = host.partition(":")
+    if separator and not (port and _DOCKER_PORT_CHARS.issuperset(port)):
+        return False
+
+    return all(
+        label and _DOCKER_HOST_LABEL_CHARS.issuperset(label)
+        for label in host.split(".")
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_docker_resource_id(resource_id: str) -> str:
+    """Validate and convert a Docker resource ID into a Docker registry name.
+
+    The result is memoized because the same resource IDs are parsed
+    repeatedly when connectors are validated, verified and connected.
+
+    Args:
+        resource_id: The resource ID to convert.
+
+    Returns:
+        The Docker registry name.
+
+    Raises:
+        ValueError: If the provided resource ID is not a valid Docker
+            registry.
+    """
+    registry: Optional[str] = None
+    if _is_valid_docker_resource_id(resource_id):
+        # The resource ID is a repository URL
+        if resource_id.startswith(("https://", "http://")):
+            registry = resource_id.partition("://")[2].partition("/")[0]
+        else:
+            registry = resource_id.partition("/")[0]
+    else:
+        raise ValueError(
+            f"Invalid resource ID for a Docker registry: {resource_id}. "
+            f"Please provide a valid repository name or URL in the "
+            f"following format:\n"
+            "DockerHub: docker.io or [https://]index.docker.io/v1/[/<repository-name>]"
+            "generic OCI registry URI: http[s]://host[:port][/<repository-name>]"
+        )
+
+    if registry == f"index.{DOCKER_REGISTRY_NAME}":
+        registry = DOCKER_REGISTRY_NAME
+    return registry
+
 
 class DockerAuthenticationMethods(StrEnum):
     """Docker Authentication methods."""
@@ -71,10 +236,24 @@ class DockerAuthenticationMethods(StrEnum):
     PASSWORD = "password"
 
 
-DOCKER_SERVICE_CONNECTOR_TYPE_SPEC = ServiceConnectorTypeModel(
-    name="Docker Service Connector",
-    connector_type=DOCKER_CONNECTOR_TYPE,
-    description="""
+_DOCKER_AUTH_METHOD_VALUES = tuple(DockerAuthenticationMethods.values())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_docker_connector_type_spec() -> ServiceConnectorTypeModel:
+    """Build the Docker service connector specification.
+
+    The specification is built lazily on first access and then cached, so
+    that importing this module doesn't pay for constructing and validating
+    the nested connector models.
+
+    Returns:
+        The Docker service connector specification.
+    """
+    return ServiceConnectorTypeModel(
+        name="Docker Service Connector",
+        connector_type=DOCKER_CONNECTOR_TYPE,
+        description="""
 The ZenML Docker Service Connector allows authenticating with a Docker or OCI
 container registry and managing Docker clients for the registry. 
 
@@ -86,24 +265,24 @@ are included in the base ZenML Python package. Docker needs to be installed on
 environments where container images are built and pushed to the target container
 registry.
 """,
-    logo_url="https://public-flavor-logos.s3.eu-central-1.amazonaws.com/container_registry/docker.png",
-    emoji=":whale:",
-    auth_methods=[
-        AuthenticationMethodModel(
-            name="Docker username and password/token",
-            auth_method=DockerAuthenticationMethods.PASSWORD,
-            description="""
+        logo_url="https://public-flavor-logos.s3.eu-central-1.amazonaws.com/container_registry/docker.png",
+        emoji=":whale:",
+        auth_methods=[
+            AuthenticationMethodModel(
+                name="Docker username and password/token",
+                auth_method=DockerAuthenticationMethods.PASSWORD,
+                description="""
 Use a username and password or access token to authenticate with a container
 registry server.
 """,
-            config_class=DockerConfiguration,
-        ),
-    ],
-    resource_types=[
-        ResourceTypeModel(
-            name="Docker/OCI container registry",
-            resource_type=DOCKER_REGISTRY_RESOURCE_TYPE,
-            description="""
+                config_class=DockerConfiguration,
+            ),
+        ],
+        resource_types=[
+            ResourceTypeModel(
+                name="Docker/OCI container registry",
+                resource_type=DOCKER_REGISTRY_RESOURCE_TYPE,
+                description="""
 Allows users to access a Docker or OCI compatible container registry as a
 resource. When used by connector consumers, they are provided a
 pre-authenticated python-docker client instance.
@@ -114,15 +293,35 @@ formats (the repository name is optional).
 - DockerHub: docker.io or [https://]index.docker.io/v1/[/<repository-name>]
 - generic OCI registry URI: http[s]://host[:port][/<repository-name>]
 """,
-            auth_methods=DockerAuthenticationMethods.values(),
-            # Request a Docker repository to be configured in the
-            # connector or provided by the consumer.
-            supports_instances=False,
-            logo_url="https://public-flavor-logos.s3.eu-central-1.amazonaws.com/container_registry/docker.png",
-            emoji=":whale:",
-        ),
-    ],
-)
+                auth_methods=list(_DOCKER_AUTH_METHOD_VALUES),
+                # Request a Docker repository to be configured in the
+                # connector or provided by the consumer.
+                supports_instances=False,
+                logo_url="https://public-flavor-logos.s3.eu-central-1.amazonaws.com/container_registry/docker.png",
+                emoji=":whale:",
+            ),
+        ],
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily built module attributes.
+
+    Keeps `DOCKER_SERVICE_CONNECTOR_TYPE_SPEC` importable from this module
+    while the specification is only built on first access.
+
+    Args:
+        name: The name of the attribute.
+
+    Returns:
+        The attribute value.
+
+    Raises:
+        AttributeError: If the module has no attribute with the given name.
+    """
+    if name == "DOCKER_SERVICE_CONNECTOR_TYPE_SPEC":
+        return _get_docker_connector_type_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class DockerServiceConnector(ServiceConnector):
@@ -130,6 +329,35 @@ class DockerServiceConnector(ServiceConnector):
 
     config: DockerConfiguration
 
+    _docker_client: Optional["DockerClient"] = None
+    _docker_client_lock: threading.Lock = PrivateAttr(
+        default_factory=threading.Lock
+    )
+    _auth_cache: Dict[Tuple[str, str], float] = {}
+    _verified_logins: Dict[Tuple[str, str], float] = {}
+    _parsed_resource_id: Optional[Tuple[str, str]] = None
+
+    def copy(self, **kwargs: Any) -> "DockerServiceConnector":
+        """Copy the connector without its Docker client.
+
+        Pydantic copies private attributes by reference, so without this a
+        copy would share the cached Docker client and login cache of this
+        connector (e.g. closing a connector client would close the Docker
+        client of the connector it was copied from).
+
+        Args:
+            kwargs: Keyword arguments passed to `BaseModel.copy`.
+
+        Returns:
+            The connector copy.
+        """
+        connector_copy = super().copy(**kwargs)
+        connector_copy._docker_client = None
+        connector_copy._docker_client_lock = threading.Lock()
+        connector_copy._auth_cache = {}
+        connector_copy._verified_logins = {}
+        return connector_copy
+
     @classmethod
     def _get_connector_type(cls) -> ServiceConnectorTypeModel:
         """Get the service connector specification.
@@ -137,7 +365,7 @@ class DockerServiceConnector(ServiceConnector):
         Returns:
             The service connector specification.
         """
-        return DOCKER_SERVICE_CONNECTOR_TYPE_SPEC
+        return _get_docker_connector_type_spec()
 
     @classmethod
     def _parse_resource_id(
@@ -156,30 +384,34 @@ class DockerServiceConnector(ServiceConnector):
             ValueError: If the provided resource ID is not a valid Docker
                 registry.
         """
-        registry: Optional[str] = None
-        if re.match(
-            r"^(https?://)?[a-zA-Z0-9-]+(\.[a-zA-Z0-9-]+)*(:[0-9]+)?(/.+)*$",
-            resource_id,
+        return _parse_docker_resource_id(resource_id)
+
+    def _get_registry(self, resource_id: Optional[str] = None) -> str:
+        """Get the Docker registry name for a resource ID.
+
+        The registry name of the connector's own resource ID is cached on the
+        instance and parsed again only if the resource ID changes.
+
+        Args:
+            resource_id: The resource ID to get the registry name for. Defaults
+                to the connector's resource ID.
+
+        Returns:
+            The Docker registry name.
+        """
+        if resource_id is not None and resource_id != self.resource_id:
+            return self._parse_resource_id(resource_id)
+
+        assert self.resource_id is not None
+        if (
+            self._parsed_resource_id is None
+            or self._parsed_resource_id[0] != self.resource_id
         ):
-            # The resource ID is a repository URL
-            if resource_id.startswith("https://") or resource_id.startswith(
-                "http://"
-            ):
-                registry = resource_id.split("/")[2]
-            else:
-                registry = resource_id.split("/")[0]
-        else:
-            raise ValueError(
-                f"Invalid resource ID for a Docker registry: {resource_id}. "
-                f"Please provide a valid repository name or URL in the "
-                f"following format:\n"
-                "DockerHub: docker.io or [https://]index.docker.io/v1/[/<repository-name>]"
-                "generic OCI registry URI: http[s]://host[:port][/<repository-name>]"
+            self._parsed_resource_id = (
+                self.resource_id,
+                self._parse_resource_id(self.resource_id),
             )
-
-        if registry == f"index.{DOCKER_REGISTRY_NAME}":
-            registry = DOCKER_REGISTRY_NAME
-        return registry
+        return self._parsed_resource_id[1]
 
     def _canonical_resource_id(
         self, resource_type: str, resource_id: str
@@ -193,7 +425,7 @@ class DockerServiceConnector(ServiceConnector):
         Returns:
             The canonical resource ID.
         """
-        return self._parse_resource_id(resource_id)
+        return self._get_registry(resource_id)
 
     def _get_default_resource_id(self, resource_type: str) -> str:
         """Get the default resource ID for a resource type.
@@ -212,35 +444,135 @@ class DockerServiceConnector(ServiceConnector):
 
     def _authorize_client(
         self,
-        docker_client: DockerClient,
-        resource_id: str,
+        docker_client: "DockerClient",
+        resource_id: Optional[str] = None,
     ) -> None:
         """Authorize a Docker client to have access to the configured Docker registry.
 
         Args:
             docker_client: The Docker client to authenticate.
-            resource_id: The resource ID to authorize the client for.
+            resource_id: The resource ID to authorize the client for. Defaults
+                to the connector's resource ID.
 
         Raises:
             AuthorizationException: If the client could not be authenticated.
         """
+        from docker.errors import APIError, DockerException
+
         cfg = self.config
-        registry = self._parse_resource_id(resource_id)
+        registry = self._get_registry(resource_id)
+        username = cfg.username.get_secret_value()
+        password = cfg.password.get_secret_value()
+
+        # Logins are only cached for the connector's own Docker client, which
+        # keeps its authentication state between calls
+        cache_key = (registry, username)
+        is_cached_client = docker_client is self._docker_client
+        if is_cached_client and self._has_cached_login(registry, username):
+            return
 
         try:
             docker_client.login(
-                username=cfg.username.get_secret_value(),
-                password=cfg.password.get_secret_value(),
+                username=username,
+                password=password,
                 registry=registry
                 if registry != DOCKER_REGISTRY_NAME
                 else None,
                 reauth=True,
             )
         except DockerException as e:
+            if isinstance(e, APIError):
+                self._auth_cache.pop(cache_key, None)
             raise AuthorizationException(
                 f"failed to authenticate with Docker registry {registry}: {e}"
             )
 
+        logged_in_at = time.monotonic()
+        self._verified_logins[cache_key] = logged_in_at
+        if is_cached_client:
+            self._auth_cache[cache_key] = logged_in_at
+
+    def _has_cached_login(self, registry: str, username: str) -> bool:
+        """Check whether the Docker client of this connector is logged in.
+
+        Args:
+            registry: The Docker registry name.
+            username: The username used to log in.
+
+        Returns:
+            True if the Docker client of this connector successfully logged in
+            to the registry with the username less than
+            `DOCKER_LOGIN_CACHE_TTL` seconds ago, False otherwise.
+        """
+        return self._is_recent_login(self._auth_cache, registry, username)
+
+    def _has_verified_login(self, registry: str, username: str) -> bool:
+        """Check whether the credentials were recently used to log in.
+
+        Args:
+            registry: The Docker registry name.
+            username: The username used to log in.
+
+        Returns:
+            True if any Docker client of this connector successfully logged in
+            to the registry with the username less than
+            `DOCKER_LOGIN_CACHE_TTL` seconds ago, False otherwise.
+        """
+        return self._is_recent_login(self._verified_logins, registry, username)
+
+    @staticmethod
+    def _is_recent_login(
+        logins: Dict[Tuple[str, str], float], registry: str, username: str
+    ) -> bool:
+        """Check whether a recorded login is younger than the login TTL.
+
+        Args:
+            logins: The login times, keyed by registry and username.
+            registry: The Docker registry name.
+            username: The username used to log in.
+
+        Returns:
+            True if the login happened less than `DOCKER_LOGIN_CACHE_TTL`
+            seconds ago, False otherwise.
+        """
+        logged_in_at = logins.get((registry, username))
+        return (
+            logged_in_at is not None
+            and time.monotonic() - logged_in_at < DOCKER_LOGIN_CACHE_TTL
+        )
+
+    def _get_docker_client(self) -> "DockerClient":
+        """Initialize and/or return the Docker client of this connector.
+
+        The client is created once per connector instance and reused, to avoid
+        re-negotiating the API version with the Docker daemon on every call.
+
+        Returns:
+            The Docker client.
+        """
+        from docker.client import DockerClient
+
+        with self._docker_client_lock:
+            if self._docker_client is None:
+                self._docker_client = DockerClient.from_env()
+                # Connector copies share private attributes by reference, so
+                # the cache is replaced instead of cleared: cached logins are
+                # only valid for the client that performed them
+                self._auth_cache = {}
+            return self._docker_client
+
+    def close(self) -> None:
+        """Close the Docker client cached by this connector, if any.
+
+        Clients previously returned by `connect` share the cached client and
+        can't be used after this call.
+        """
+        with self._docker_client_lock:
+            if self._docker_client is not None:
+                self._docker_client.close()
+                self._docker_client = None
+            self._auth_cache = {}
+
     def _connect_to_resource(
         self,
         **kwargs: Any,
@@ -257,52 +589,159 @@ class DockerServiceConnector(ServiceConnector):
             An authenticated python-docker client object.
         """
         assert self.resource_id is not None
-        docker_client = DockerClient.from_env()
-        self._authorize_client(docker_client, self.resource_id)
+        docker_client = self._get_docker_client()
+        self._authorize_client(docker_client)
 
         return docker_client
 
-    def _configure_local_client(
+    def _store_local_credentials(
         self,
-        **kwargs: Any,
+        registry: str,
+        username: str,
+        password: str,
+    ) -> bool:
+        """Store registry credentials for the local Docker client directly.
+
+        This does what `docker login` does after it verified the credentials,
+        without paying for the Docker CLI startup, but only if a credential
+        helper is configured for the registry (`credHelpers`) or globally
+        (`credsStore`) in the Docker client configuration: the credentials
+        are then handed to that helper. Without a configured helper, the
+        Docker CLI detects the default credential store of the platform and
+        only falls back to storing unencrypted credentials in the
+        configuration file (with a warning), which is left to the CLI.
+
+        Args:
+            registry: The Docker registry name.
+            username: The username to store.
+            password: The password or token to store.
+
+        Returns:
+            True if the credentials were stored by a credential helper, False
+            if they have to be stored through the Docker CLI instead.
+        """
+        import subprocess
+
+        server_url = (
+            DOCKER_HUB_SERVER_URL
+            if registry == DOCKER_REGISTRY_NAME
+            else registry
+        )
+        docker_config = _read_docker_config()
+        if docker_config is None:
+            return False
+
+        cred_helpers = docker_config.get("credHelpers")
+        helper = (
+            cred_helpers.get(server_url)
+            if isinstance(cred_helpers, dict)
+            else None
+        ) or docker_config.get("credsStore")
+        if not helper:
+            return False
+
+        credentials = bytearray(
+            json.dumps(
+                {
+                    "ServerURL": server_url,
+                    "Username": username,
+                    "Secret": password,
+                }
+            ).encode()
+        )
+        try:
+            returncode, stderr = _run_with_secret_input(
+                [f"docker-credential-{helper}", "store"], credentials
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        if stderr.strip():
+            logger.warning(
+                f"Docker credential helper `{helper}`: "
+                f"{stderr.decode(errors='replace').strip()}"
+            )
+        return returncode == 0
+
+    def _login_one(
+        self,
+        resource_id: str,
+        username: str,
+        password: str,
     ) -> None:
-        """Configure the local Docker client to authenticate to a Docker/OCI registry.
+        """Authenticate the local Docker client to a Docker/OCI registry.
+
+        If this connector just logged in to the registry with the same
+        credentials (e.g. while verifying the connector) and a Docker
+        credential helper is configured, the credentials are handed to that
+        helper directly. Otherwise, or if that fails, `docker login` is called
+        to verify and store them.
 
         Args:
-            kwargs: Additional implementation specific keyword arguments to use
-                to configure the client.
+            resource_id: The resource ID of the registry to log in to.
+            username: The username to log in with.
+            password: The password or token to log in with.
 
         Raises:
             AuthorizationException: If authentication failed.
         """
-        # Call the docker CLI to authenticate to the Docker registry
-        cfg = self.config
-
-        assert self.resource_id is not None
-        registry = self._parse_resource_id(self.resource_id)
+        import subprocess
+
+        registry = self._get_registry(resource_id)
+        # Storing the credentials directly skips checking them against the
+        # registry, which is only safe if they were just used to log in
+        is_verified = self._has_verified_login(registry, username)
+        if is_verified and self._store_local_credentials(
+            registry, username, password
+        ):
+            return
 
+        # Call the docker CLI to authenticate to the Docker registry
         docker_login_cmd = [
             "docker",
             "login",
             "-u",
-            cfg.username.get_secret_value(),
+            username,
             "--password-stdin",
         ]
         if registry != DOCKER_REGISTRY_NAME:
             docker_login_cmd.append(registry)
 
         try:
-            subprocess.run(
-                docker_login_cmd,
-                check=True,
-                input=cfg.password.get_secret_value().encode(),
+            returncode, stderr = _run_with_secret_input(
+                docker_login_cmd, bytearray(password.encode())
             )
-        except subprocess.CalledProcessError as e:
+        except subprocess.TimeoutExpired as e:
             raise AuthorizationException(
                 f"Failed to authenticate to Docker registry "
-                f"'{self.resource_id}': {e}"
+                f"'{resource_id}': {e}"
             ) from e
 
+        if returncode != 0:
+            raise AuthorizationException(
+                f"Failed to authenticate to Docker registry "
+                f"'{resource_id}': {stderr.decode(errors='replace')}"
+            )
+        if stderr.strip():
+            # e.g. the warning about storing the credentials unencrypted
+            logger.warning(stderr.decode(errors="replace").strip())
+
+    def _configure_local_client(
+        self,
+        **kwargs: Any,
+    ) -> None:
+        """Configure the local Docker client to authenticate to a Docker/OCI registry.
+
+        Args:
+            kwargs: Additional implementation specific keyword arguments to use
+                to configure the client.
+        """
+        assert self.resource_id is not None
+        self._login_one(
+            self.resource_id,
+            self.config.username.get_secret_value(),
+            self.config.password.get_secret_value(),
+        )
+
     @classmethod
     def _auto_configure(
         cls,
@@ -349,6 +788,9 @@ class DockerServiceConnector(ServiceConnector):
         Returns:
             The name of the Docker registry that this connector can access.
         """
+        from docker.client import DockerClient
+        from docker.errors import DockerException
+
         # The docker server isn't available on the ZenML server, so we can't
         # verify the credentials there.
         try:
@@ -360,7 +802,12 @@ class DockerServiceConnector(ServiceConnector):
             )
         else:
             assert resource_id is not None
-            self._authorize_client(docker_client, resource_id)
-            docker_client.close()
+            # Successful logins are recorded by the connector, so that the
+            # credentials can later be stored for the local Docker client
+            # without verifying them again
+            try:
+                self._authorize_client(docker_client, resource_id)
+            finally:
+                docker_client.close()
 
         return [resource_id] if resource_id else []
@@ -64,6 +64,9 @@ PARAM_ON_SUCCESS = "on_success"
 
 logger = get_logger(__name__)
 
+# Whether the deprecation warning of the `@step` decorator was already logged
+_DEPRECATION_WARNED = False
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 
@@ -163,12 +166,15 @@ def step(
         The inner decorator which creates the step class based on the
         ZenML BaseStep
     """
-    logger.warning(
-        "The `@step` decorator that you use to define your step is "
-        "deprecated. Check out our docs https://docs.zenml.io for "
-        "information on how to define steps in a more intuitive and "
-        "flexible way!"
-    )
+    global _DEPRECATION_WARNED
+    if not _DEPRECATION_WARNED:
+        logger.warning(
+            "The `@step` decorator that you use to define your step is "
+            "deprecated. Check out our docs https://docs.zenml.io for "
+            "information on how to define steps in a more intuitive and "
+            "flexible way!"
+        )
+        _DEPRECATION_WARNED = True
 
     def inner_decorator(func: F) -> Type[BaseStep]:
         """Inner decorator function for the creation of a ZenML Step.
@@ -180,24 +186,35 @@ def step(
         Returns:
             The class of a newly generated ZenML Step.
         """
+        # Only store explicitly configured values, the step defaults for all
+        # of them are `None` anyway
+        class_config = {
+            key: value
+            for key, value in (
+                (PARAM_STEP_NAME, name),
+                (PARAM_ENABLE_CACHE, enable_cache),
+                (PARAM_ENABLE_ARTIFACT_METADATA, enable_artifact_metadata),
+                (
+                    PARAM_ENABLE_ARTIFACT_VISUALIZATION,
+                    enable_artifact_visualization,
+                ),
+                (PARAM_EXPERIMENT_TRACKER, experiment_tracker),
+                (PARAM_STEP_OPERATOR, step_operator),
+                (PARAM_OUTPUT_MATERIALIZERS, output_materializers),
+                (PARAM_SETTINGS, settings),
+                (PARAM_EXTRA_OPTIONS, extra),
+                (PARAM_ON_FAILURE, on_failure),
+                (PARAM_ON_SUCCESS, on_success),
+            )
+            if value is not None
+        }
+
         return type(  # noqa
             func.__name__,
             (_DecoratedStep,),
             {
                 STEP_INNER_FUNC_NAME: staticmethod(func),
-                CLASS_CONFIGURATION: {
-                    PARAM_STEP_NAME: name,
-                    PARAM_ENABLE_CACHE: enable_cache,
-                    PARAM_ENABLE_ARTIFACT_METADATA: enable_artifact_metadata,
-                    PARAM_ENABLE_ARTIFACT_VISUALIZATION: enable_artifact_visualization,
-                    PARAM_EXPERIMENT_TRACKER: experiment_tracker,
-                    PARAM_STEP_OPERATOR: step_operator,
-                    PARAM_OUTPUT_MATERIALIZERS: output_materializers,
-                    PARAM_SETTINGS: settings,
-                    PARAM_EXTRA_OPTIONS: extra,
-                    PARAM_ON_FAILURE: on_failure,
-                    PARAM_ON_SUCCESS: on_success,
-                },
+                CLASS_CONFIGURATION: class_config,
                 "__module__": func.__module__,
                 "__doc__": func.__doc__,
             },
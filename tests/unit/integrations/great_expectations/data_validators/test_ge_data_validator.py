@@ -0,0 +1,456 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+import pytest
+
+from zenml.enums import StackComponentType
+from zenml.integrations.great_expectations.data_validators.ge_data_validator import (
+    GreatExpectationsDataValidator,
+)
+from zenml.integrations.great_expectations.flavors.great_expectations_data_validator_flavor import (
+    GreatExpectationsDataValidatorConfig,
+)
+
+
+def _get_data_validator(
+    id: Optional[UUID] = None, **config: Any
+) -> GreatExpectationsDataValidator:
+    """Creates a Great Expectations data validator stack component."""
+    return GreatExpectationsDataValidator(
+        name="arias_validator",
+        id=id or uuid4(),
+        config=GreatExpectationsDataValidatorConfig(**config),
+        flavor="great_expectations",
+        type=StackComponentType.DATA_VALIDATOR,
+        user=uuid4(),
+        workspace=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_data_context_cache():
+    """Clears the process-level GE data context cache around each test."""
+    GreatExpectationsDataValidator.invalidate_context()
+    yield
+    GreatExpectationsDataValidator.invalidate_context()
+
+
+@pytest.fixture
+def artifact_store(mocker):
+    """Mocks the artifact store of the active stack."""
+    artifact_store = mocker.MagicMock(id=uuid4(), flavor="local")
+    client = mocker.patch(
+        "zenml.integrations.great_expectations.data_validators."
+        "ge_data_validator.Client"
+    )
+    client.return_value.active_stack.artifact_store = artifact_store
+    return artifact_store
+
+
+@pytest.fixture
+def create_data_context(mocker):
+    """Mocks the creation of GE data contexts."""
+    return mocker.patch.object(
+        GreatExpectationsDataValidator,
+        "_create_data_context",
+        side_effect=lambda artifact_store: object(),
+    )
+
+
+def test_data_context_is_reused_across_data_validator_instances(
+    artifact_store, create_data_context
+):
+    """Tests that equally configured data validators share a data context."""
+    validator_id = uuid4()
+    first = _get_data_validator(id=validator_id)
+    second = _get_data_validator(id=validator_id)
+
+    assert first.data_context is second.data_context
+    # the context is also cached on the data validator instance
+    assert first.data_context is first.data_context
+    create_data_context.assert_called_once_with(artifact_store)
+
+
+def test_data_context_is_not_shared_between_different_configurations(
+    artifact_store, create_data_context
+):
+    """Tests that differently configured data validators use other contexts."""
+    validator_id = uuid4()
+    context = _get_data_validator(id=validator_id).data_context
+
+    assert _get_data_validator().data_context is not context
+    assert (
+        _get_data_validator(
+            id=validator_id, configure_local_docs=False
+        ).data_context
+        is not context
+    )
+
+    artifact_store.id = uuid4()
+    assert _get_data_validator(id=validator_id).data_context is not context
+    assert create_data_context.call_count == 4
+
+
+def test_invalidate_context_drops_cached_data_contexts(
+    artifact_store, create_data_context
+):
+    """Tests that data contexts are re-created after invalidating the cache."""
+    validator_id = uuid4()
+    context = _get_data_validator(id=validator_id).data_context
+
+    GreatExpectationsDataValidator.invalidate_context()
+
+    assert _get_data_validator(id=validator_id).data_context is not context
+    assert create_data_context.call_count == 2
+
+
+@pytest.fixture
+def data_context(mocker):
+    """Mocks the data context of the data validator."""
+    context = mocker.MagicMock(usage_statistics_handler=None)
+    mocker.patch.object(
+        GreatExpectationsDataValidator,
+        "data_context",
+        new_callable=mocker.PropertyMock,
+        return_value=context,
+    )
+    return context
+
+
+@pytest.fixture
+def batch_requests(mocker):
+    """Mocks the creation and release of GE batch requests."""
+    create = mocker.patch(
+        "zenml.integrations.great_expectations.utils.create_batch_request",
+        side_effect=lambda context, dataset, data_asset_name: dataset,
+    )
+    release = mocker.patch(
+        "zenml.integrations.great_expectations.utils.release_batch_request"
+    )
+    return create, release
+
+
+def _mock_checkpoint_class(mocker, run):
+    """Mocks the GE checkpoint class with the given run implementation."""
+
+    def _create_checkpoint(data_context, **config):
+        checkpoint = mocker.MagicMock(config=config)
+        checkpoint.run.side_effect = run
+        return checkpoint
+
+    return mocker.patch(
+        "great_expectations.checkpoint.Checkpoint",
+        side_effect=_create_checkpoint,
+    )
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_data_validation_many_preserves_result_order(
+    mocker, data_context, batch_requests, parallel
+):
+    """Tests that validation results are returned in the supplied order."""
+    _mock_checkpoint_class(
+        mocker,
+        run=lambda validations: f"result_{validations[0]['batch_request']}",
+    )
+    validations = [(f"dataset_{i}", "suite", None) for i in range(5)]
+
+    results = _get_data_validator().data_validation_many(
+        validations, parallel=parallel
+    )
+
+    assert results == [f"result_dataset_{i}" for i in range(5)]
+    _, release = batch_requests
+    assert [c[0][1] for c in release.call_args_list] == [
+        dataset for dataset, _, _ in validations
+    ]
+
+
+def test_data_validation_many_builds_data_docs_once_when_parallel(
+    mocker, data_context, batch_requests
+):
+    """Tests that parallel checkpoints don't update the data docs."""
+    checkpoint_class = _mock_checkpoint_class(
+        mocker, run=lambda validations: None
+    )
+
+    _get_data_validator().data_validation_many(
+        [("first", "suite", None), ("second", "suite", None)], parallel=True
+    )
+
+    for call in checkpoint_class.call_args_list:
+        action_classes = [
+            action["action"]["class_name"] for action in call[1]["action_list"]
+        ]
+        assert "StoreValidationResultAction" in action_classes
+        assert "UpdateDataDocsAction" not in action_classes
+    data_context.build_data_docs.assert_called_once()
+
+
+def test_data_validation_many_releases_batch_requests_on_error(
+    mocker, data_context, batch_requests
+):
+    """Tests that batch requests are released if a validation fails."""
+
+    def run(validations):
+        if validations[0]["batch_request"] == "second":
+            raise RuntimeError("validation failed")
+
+    _mock_checkpoint_class(mocker, run=run)
+    validations = [(name, "suite", None) for name in ("first", "second")]
+
+    for parallel in (False, True):
+        _, release = batch_requests
+        release.reset_mock()
+        with pytest.raises(RuntimeError):
+            _get_data_validator().data_validation_many(
+                validations, parallel=parallel
+            )
+
+        assert [c[0][1] for c in release.call_args_list] == [
+            "first",
+            "second",
+        ]
+    data_context.build_data_docs.assert_not_called()
+
+
+@pytest.fixture
+def in_memory_data_context(mocker):
+    """Uses an in-memory GE data context for the data validator."""
+    from great_expectations.data_context.data_context import BaseDataContext
+    from great_expectations.data_context.types.base import (
+        DataContextConfig,
+        InMemoryStoreBackendDefaults,
+    )
+
+    context = BaseDataContext(
+        project_config=DataContextConfig(
+            store_backend_defaults=InMemoryStoreBackendDefaults()
+        )
+    )
+    mocker.patch.object(
+        GreatExpectationsDataValidator,
+        "data_context",
+        new_callable=mocker.PropertyMock,
+        return_value=context,
+    )
+    return context
+
+
+@pytest.fixture
+def profiler_class(mocker):
+    """Spies on the GE profiler used for data profiling."""
+    from great_expectations.profile import user_configurable_profiler
+
+    return mocker.patch.object(
+        user_configurable_profiler,
+        "UserConfigurableProfiler",
+        wraps=user_configurable_profiler.UserConfigurableProfiler,
+    )
+
+
+def test_data_profiling_skips_profiler_for_identical_dataset(
+    in_memory_data_context, profiler_class
+):
+    """Tests that profiling the same dataset again re-uses the suite."""
+    import pandas as pd
+
+    data_validator = _get_data_validator()
+    dataset = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+    suite = data_validator.data_profiling(
+        dataset, expectation_suite_name="suite"
+    )
+    assert profiler_class.call_count == 1
+
+    assert (
+        data_validator.data_profiling(
+            dataset.copy(), expectation_suite_name="suite"
+        )
+        == suite
+    )
+    assert profiler_class.call_count == 1
+
+
+def test_data_profiling_reruns_profiler_for_different_dataset(
+    in_memory_data_context, profiler_class
+):
+    """Tests that changed data or profiler arguments re-run the profiler."""
+    import pandas as pd
+
+    data_validator = _get_data_validator()
+    dataset = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+    data_validator.data_profiling(dataset, expectation_suite_name="suite")
+    data_validator.data_profiling(
+        pd.DataFrame({"a": [1, 2, 4], "b": ["x", "y", "z"]}),
+        expectation_suite_name="suite",
+    )
+    assert profiler_class.call_count == 2
+
+    data_validator.data_profiling(
+        dataset,
+        expectation_suite_name="suite",
+        profiler_kwargs={"ignored_columns": ["b"]},
+    )
+    assert profiler_class.call_count == 3
+
+
+@pytest.mark.parametrize("usage_statistics", [False, True])
+def test_parallel_data_validation_on_real_data_context(
+    mocker, usage_statistics
+):
+    """Tests running validations in parallel on a real GE data context.
+
+    GE usage statistics keep per-run state on a handler that is shared by
+    all checkpoints of a data context, so they can't run concurrently.
+    """
+    import pandas as pd
+    from great_expectations.data_context.data_context import BaseDataContext
+    from great_expectations.data_context.types.base import (
+        AnonymizedUsageStatisticsConfig,
+        DataContextConfig,
+        InMemoryStoreBackendDefaults,
+    )
+
+    context = BaseDataContext(
+        project_config=DataContextConfig(
+            store_backend_defaults=InMemoryStoreBackendDefaults(),
+            anonymous_usage_statistics=AnonymizedUsageStatisticsConfig(
+                enabled=usage_statistics,
+                usage_statistics_url="http://127.0.0.1:9",
+            ),
+        )
+    )
+    assert (context.usage_statistics_handler is not None) == usage_statistics
+    context.create_expectation_suite("suite")
+    mocker.patch.object(
+        GreatExpectationsDataValidator,
+        "data_context",
+        new_callable=mocker.PropertyMock,
+        return_value=context,
+    )
+
+    results = _get_data_validator().data_validation_many(
+        [(pd.DataFrame({"a": [i]}), "suite", None) for i in range(8)],
+        parallel=True,
+    )
+
+    assert len(results) == 8
+    assert all(result.success for result in results)
+
+
+def test_data_profiling_with_unhashable_dataset_values(
+    in_memory_data_context, profiler_class
+):
+    """Tests profiling datasets whose contents can't be fingerprinted."""
+    import pandas as pd
+
+    from zenml.integrations.great_expectations.data_validators.ge_data_validator import (
+        DATASET_FINGERPRINT_META_KEY,
+    )
+
+    data_validator = _get_data_validator()
+    dataset = pd.DataFrame({"a": [[1], [2], [3]], "b": [1, 2, 3]})
+    profiler_kwargs = {"ignored_columns": ["a"]}
+
+    data_validator.data_profiling(
+        pd.DataFrame({"a": [1, 2, 3], "b": [1, 2, 3]}),
+        expectation_suite_name="suite",
+        profiler_kwargs=profiler_kwargs,
+    )
+    for _ in range(2):
+        suite = data_validator.data_profiling(
+            dataset,
+            expectation_suite_name="suite",
+            profiler_kwargs=profiler_kwargs,
+        )
+        assert DATASET_FINGERPRINT_META_KEY not in suite.meta
+
+    assert profiler_class.call_count == 3
+
+
+@pytest.fixture
+def context_config():
+    """A valid in-memory GE data context configuration."""
+    from great_expectations.data_context.types.base import (
+        DataContextConfig,
+        InMemoryStoreBackendDefaults,
+    )
+
+    context_config = DataContextConfig(
+        store_backend_defaults=InMemoryStoreBackendDefaults()
+    ).to_json_dict()
+    # the serialized usage statistics config can't be loaded again
+    context_config.pop("anonymous_usage_statistics")
+    return context_config
+
+
+def _get_data_validator_with_context_config(
+    context_config: str,
+) -> GreatExpectationsDataValidator:
+    """Creates a data validator with an unparsed context configuration."""
+    data_validator = _get_data_validator()
+    # string configurations bypass the validation of the config model
+    data_validator._config = GreatExpectationsDataValidatorConfig.construct(
+        context_config=context_config
+    )
+    return data_validator
+
+
+def test_json_context_config_is_parsed_without_yaml(mocker, context_config):
+    """Tests that JSON context configurations are parsed with `json`."""
+    import json
+
+    import yaml
+
+    yaml_load = mocker.spy(yaml, "load")
+    data_validator = _get_data_validator_with_context_config(
+        json.dumps(context_config)
+    )
+
+    assert data_validator.context_config == context_config
+    yaml_load.assert_not_called()
+
+
+@pytest.mark.parametrize("flow_style", [False, True])
+def test_yaml_context_config_is_parsed_with_yaml(
+    mocker, context_config, flow_style
+):
+    """Tests that YAML context configurations fall back to `yaml`."""
+    import yaml
+
+    yaml_load = mocker.spy(yaml, "load")
+    data_validator = _get_data_validator_with_context_config(
+        yaml.dump(context_config, default_flow_style=flow_style)
+    )
+
+    assert data_validator.context_config == context_config
+    yaml_load.assert_called_once()
+
+
+def test_malformed_context_config_raises_value_error():
+    """Tests that unparsable context configurations raise a ValueError."""
+    data_validator = _get_data_validator_with_context_config(
+        "{stores: [unclosed"
+    )
+
+    with pytest.raises(ValueError, match="Malformed `context_config`"):
+        data_validator.context_config
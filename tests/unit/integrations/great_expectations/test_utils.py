@@ -0,0 +1,126 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import pandas as pd
+import pytest
+from great_expectations.data_context import FileDataContext
+from great_expectations.data_context.data_context import BaseDataContext
+from great_expectations.data_context.types.base import (
+    DataContextConfig,
+    InMemoryStoreBackendDefaults,
+)
+
+from zenml.integrations.great_expectations.utils import (
+    RUNTIME_DATASOURCE_NAME_PREFIX,
+    create_batch_request,
+    get_dataset_fingerprint,
+    release_batch_request,
+)
+
+
+@pytest.fixture
+def dataset():
+    """A small pandas dataset."""
+    return pd.DataFrame({"a": [1, 2, 3]})
+
+
+@pytest.fixture
+def in_memory_context():
+    """An in-memory GE data context."""
+    return BaseDataContext(
+        project_config=DataContextConfig(
+            store_backend_defaults=InMemoryStoreBackendDefaults()
+        )
+    )
+
+
+def _get_runtime_datasources(context):
+    """Get the names of the ZenML runtime datasources of a data context."""
+    return sorted(
+        datasource["name"]
+        for datasource in context.list_datasources()
+        if datasource["name"].startswith(RUNTIME_DATASOURCE_NAME_PREFIX)
+    )
+
+
+def test_in_memory_context_reuses_released_datasources(
+    in_memory_context, dataset
+):
+    """Tests that datasources are pooled for in-memory data contexts."""
+    first = create_batch_request(in_memory_context, dataset, "asset")
+    second = create_batch_request(in_memory_context, dataset, "asset")
+    assert first.datasource_name != second.datasource_name
+
+    release_batch_request(in_memory_context, first)
+    third = create_batch_request(in_memory_context, dataset, "asset")
+    assert third.datasource_name == first.datasource_name
+
+    release_batch_request(in_memory_context, second)
+    release_batch_request(in_memory_context, third)
+    assert len(_get_runtime_datasources(in_memory_context)) == 2
+
+
+def test_file_backed_context_does_not_persist_datasources(tmp_path, dataset):
+    """Tests that file-backed data contexts don't keep ZenML datasources."""
+    context = FileDataContext.create(
+        project_root_dir=str(tmp_path), usage_statistics_enabled=False
+    )
+    config_file = tmp_path / "great_expectations" / "great_expectations.yml"
+
+    batch_request = create_batch_request(context, dataset, "asset")
+    release_batch_request(context, batch_request)
+
+    assert _get_runtime_datasources(context) == []
+    assert RUNTIME_DATASOURCE_NAME_PREFIX not in config_file.read_text()
+
+
+def test_datasource_is_released_if_clearing_batch_data_fails(
+    mocker, in_memory_context, dataset
+):
+    """Tests that datasources are released even if clearing them fails."""
+    batch_request = create_batch_request(in_memory_context, dataset, "asset")
+    mocker.patch.object(
+        in_memory_context,
+        "get_datasource",
+        side_effect=AttributeError("unstable GE internals"),
+    )
+
+    release_batch_request(in_memory_context, batch_request)
+    mocker.stopall()
+
+    assert (
+        create_batch_request(
+            in_memory_context, dataset, "asset"
+        ).datasource_name
+        == batch_request.datasource_name
+    )
+
+
+def test_fingerprint_of_dataset_with_duplicate_column_names():
+    """Tests fingerprinting datasets that can't be converted to Arrow."""
+    dataset = pd.DataFrame([[1, 2], [3, 4]], columns=["a", "a"])
+
+    fingerprint = get_dataset_fingerprint(dataset)
+
+    assert fingerprint == get_dataset_fingerprint(dataset.copy())
+    assert fingerprint != get_dataset_fingerprint(
+        pd.DataFrame([[1, 2], [3, 5]], columns=["a", "a"])
+    )
+
+
+def test_fingerprint_of_dataset_with_unhashable_values():
+    """Tests that datasets with unhashable values have no fingerprint."""
+    dataset = pd.DataFrame({"a": [[1], [2]], "b": [{"c": 1}, {"c": 2}]})
+
+    assert get_dataset_fingerprint(dataset) is None
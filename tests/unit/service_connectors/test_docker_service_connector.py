@@ -0,0 +1,316 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import json
+import re
+from typing import Optional
+
+import pytest
+
+from zenml.constants import DOCKER_REGISTRY_RESOURCE_TYPE
+from zenml.service_connectors import docker_service_connector
+from zenml.service_connectors.docker_service_connector import (
+    DockerAuthenticationMethods,
+    DockerConfiguration,
+    DockerServiceConnector,
+    _is_valid_docker_resource_id,
+)
+
+# The regular expression that was previously used to validate resource IDs
+OLD_DOCKER_RESOURCE_ID_REGEX = re.compile(
+    r"^(https?://)?[a-zA-Z0-9-]+(\.[a-zA-Z0-9-]+)*(:[0-9]+)?(/.+)*$"
+)
+
+
+def _get_connector(
+    resource_id: Optional[str] = None, **config: str
+) -> DockerServiceConnector:
+    """Creates a Docker service connector.
+
+    The resource ID defaults to the configured registry or DockerHub.
+    """
+    return DockerServiceConnector(
+        auth_method=DockerAuthenticationMethods.PASSWORD,
+        resource_type=DOCKER_REGISTRY_RESOURCE_TYPE,
+        resource_id=resource_id,
+        config=DockerConfiguration(
+            **{"username": "aria", "password": "cat", **config}
+        ),
+    )
+
+
+@pytest.fixture
+def docker_clients(mocker):
+    """Mocks the creation of Docker clients."""
+    return mocker.patch(
+        "docker.client.DockerClient.from_env",
+        side_effect=lambda: mocker.MagicMock(),
+    )
+
+
+def test_docker_connector_type_spec_is_importable():
+    """Tests that the lazily built connector type spec is still importable."""
+    from zenml.service_connectors.docker_service_connector import (
+        DOCKER_SERVICE_CONNECTOR_TYPE_SPEC,
+    )
+
+    assert (
+        DOCKER_SERVICE_CONNECTOR_TYPE_SPEC is DockerServiceConnector.get_type()
+    )
+    with pytest.raises(AttributeError):
+        docker_service_connector.NOT_AN_ATTRIBUTE
+
+
+def test_connector_reuses_logins_of_its_docker_client(docker_clients):
+    """Tests that the Docker client of a connector only logs in once."""
+    connector = _get_connector()
+
+    client = connector.connect()
+    assert connector.connect() is client
+    client.login.assert_called_once()
+
+    connector.close()
+    new_client = connector.connect()
+    assert new_client is not client
+    new_client.login.assert_called_once()
+
+
+def test_connector_copies_dont_share_logins(docker_clients):
+    """Tests that a connector copy logs in with its own Docker client."""
+    connector = _get_connector()
+    connector_copy = connector.copy()
+
+    client = connector.connect()
+    copy_client = connector_copy.connect()
+
+    assert copy_client is not client
+    client.login.assert_called_once()
+    copy_client.login.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "resource_id",
+    [
+        "docker.io",
+        "index.docker.io/v1/",
+        "https://index.docker.io/v1/",
+        "https://index.docker.io/v1/my-repo",
+        "http://localhost:5000/my-repo",
+        "localhost:5000",
+        "my-registry.example.com/org/repo/image",
+        "123456789.dkr.ecr.us-east-1.amazonaws.com",
+        "registry:port",
+        "registry:",
+        "registry:5000:5000",
+        "registry/",
+        "registry//repo",
+        "registry.",
+        ".registry",
+        "registry..com",
+        "my_registry.com",
+        "ftp://registry.com",
+        "https://",
+        "https:///repo",
+        "https://https://registry.com",
+        "registry/re\npo",
+        "régistry.com",
+        "",
+    ],
+)
+def test_resource_id_validation_matches_previous_regex(resource_id):
+    """Tests that resource IDs are validated the same way as before."""
+    assert _is_valid_docker_resource_id(resource_id) == bool(
+        OLD_DOCKER_RESOURCE_ID_REGEX.match(resource_id)
+    )
+
+
+@pytest.mark.parametrize(
+    "resource_id", ["docker.io\n", "https://registry.com:5000/repo\n"]
+)
+def test_resource_id_with_trailing_newline_is_rejected(resource_id):
+    """Tests that resource IDs ending in a newline are rejected.
+
+    The previous regex accepted them because `$` also matches before a
+    trailing newline, which then ended up in the parsed registry name.
+    """
+    assert OLD_DOCKER_RESOURCE_ID_REGEX.match(resource_id)
+    assert not _is_valid_docker_resource_id(resource_id)
+    with pytest.raises(ValueError):
+        DockerServiceConnector._parse_resource_id(resource_id)
+
+
+@pytest.fixture
+def popen(mocker):
+    """Mocks the processes started by the Docker connector."""
+    popen = mocker.patch("subprocess.Popen")
+    popen.return_value.returncode = 0
+    popen.return_value.communicate.return_value = (b"", b"")
+    return popen
+
+
+def test_docker_login_logs_stderr_output(mocker, popen):
+    """Tests that the `docker login` error output isn't discarded."""
+    popen.return_value.communicate.return_value = (
+        b"Login Succeeded",
+        b"WARNING! Your password will be stored unencrypted.\n",
+    )
+    mocker.patch.object(
+        DockerServiceConnector,
+        "_store_local_credentials",
+        return_value=False,
+    )
+    warning = mocker.patch.object(docker_service_connector.logger, "warning")
+
+    _get_connector()._login_one("docker.io", "aria", "cat")
+
+    assert popen.call_args[0][0] == [
+        "docker",
+        "login",
+        "-u",
+        "aria",
+        "--password-stdin",
+    ]
+    warning.assert_called_once_with(
+        "WARNING! Your password will be stored unencrypted."
+    )
+
+
+def test_registry_is_parsed_again_when_resource_id_changes(mocker):
+    """Tests that the cached registry name follows the connector resource."""
+    connector = _get_connector()
+    assert connector._get_registry() == "docker.io"
+    parse = mocker.spy(DockerServiceConnector, "_parse_resource_id")
+
+    assert connector._get_registry() == "docker.io"
+    assert parse.call_count == 0
+
+    connector.resource_id = "https://ghcr.io/aria/repo"
+    assert connector._get_registry() == "ghcr.io"
+    assert connector._get_registry() == "ghcr.io"
+    assert parse.call_count == 1
+
+    # other resource IDs are parsed without replacing the cached value
+    assert connector._get_registry("localhost:5000") == "localhost:5000"
+    assert connector._get_registry() == "ghcr.io"
+    assert parse.call_count == 2
+
+
+@pytest.fixture
+def docker_config_dir(tmp_path, monkeypatch):
+    """Points the local Docker client configuration to a temporary path."""
+    monkeypatch.setenv("DOCKER_CONFIG", str(tmp_path))
+    return tmp_path
+
+
+def test_configure_local_client_uses_credential_helper(
+    docker_clients, docker_config_dir, popen
+):
+    """Tests storing verified credentials with a Docker credential helper."""
+    (docker_config_dir / "config.json").write_text(
+        json.dumps({"credsStore": "desktop"})
+    )
+    stored_credentials = []
+    popen.return_value.communicate.side_effect = (
+        lambda input, timeout: stored_credentials.append(bytes(input))
+        or (b"", b"")
+    )
+
+    _get_connector().configure_local_client()
+
+    assert popen.call_args[0][0] == ["docker-credential-desktop", "store"]
+    assert json.loads(stored_credentials[0]) == {
+        "ServerURL": "https://index.docker.io/v1/",
+        "Username": "aria",
+        "Secret": "cat",
+    }
+
+
+def test_configure_local_client_calls_docker_login_without_helper(
+    docker_clients, docker_config_dir, popen
+):
+    """Tests that credentials aren't stored unencrypted by the connector.
+
+    Without a configured credential helper, `docker login` picks the default
+    credential store of the platform.
+    """
+    docker_config = {"auths": {"ghcr.io": {"auth": "b3RoZXI6Y3JlZHM="}}}
+    (docker_config_dir / "config.json").write_text(json.dumps(docker_config))
+
+    _get_connector(registry="localhost:5000").configure_local_client()
+
+    assert popen.call_args[0][0] == [
+        "docker",
+        "login",
+        "-u",
+        "aria",
+        "--password-stdin",
+        "localhost:5000",
+    ]
+    assert (
+        json.loads((docker_config_dir / "config.json").read_text())
+        == docker_config
+    )
+
+
+def test_configure_local_client_calls_docker_login_if_not_verified(
+    mocker, docker_config_dir, popen
+):
+    """Tests that unverified credentials are stored with `docker login`."""
+    from docker.errors import DockerException
+
+    mocker.patch(
+        "docker.client.DockerClient.from_env",
+        side_effect=DockerException("daemon unreachable"),
+    )
+
+    _get_connector(registry="localhost:5000").configure_local_client()
+
+    assert popen.call_args[0][0] == [
+        "docker",
+        "login",
+        "-u",
+        "aria",
+        "--password-stdin",
+        "localhost:5000",
+    ]
+    assert not (docker_config_dir / "config.json").exists()
+
+
+def test_closing_a_connector_copy_keeps_the_original_client(docker_clients):
+    """Tests that connector copies don't share the cached Docker client."""
+    connector = _get_connector()
+    client = connector.connect()
+
+    connector_copy = connector.copy()
+    copy_client = connector_copy.connect()
+    connector_copy.close()
+
+    assert copy_client is not client
+    copy_client.close.assert_called_once()
+    client.close.assert_not_called()
+    assert connector.connect() is client
+
+
+def test_verification_closes_its_docker_client(mocker, docker_clients):
+    """Tests that verifying the connector doesn't leave a client open."""
+    verification_client = mocker.MagicMock()
+    docker_clients.side_effect = None
+    docker_clients.return_value = verification_client
+    connector = _get_connector()
+
+    connector.verify()
+
+    verification_client.login.assert_called_once()
+    verification_client.close.assert_called_once()
+    assert connector._docker_client is None
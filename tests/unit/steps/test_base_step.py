@@ -23,7 +23,7 @@ from zenml.materializers import BuiltInMaterializer
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.models.artifact_models import ArtifactResponseModel
 from zenml.pipelines import pipeline
-from zenml.steps import BaseParameters, Output, StepContext, step
+from zenml.steps import BaseParameters, BaseStep, Output, StepContext, step
 
 
 def test_step_decorator_creates_class_in_same_module_as_decorated_function():
@@ -737,6 +737,26 @@ def test_step_decorator_configuration_gets_applied_during_initialization(
     assert step_instance.configuration.extra == {"key": "value"}
 
 
+def test_step_decorator_only_passes_explicitly_set_options(mocker):
+    """Tests that the step class only receives the options that were set
+    in the step decorator."""
+
+    @step(enable_cache=False, extra={"key": "value"})
+    def s() -> None:
+        pass
+
+    assert s._CLASS_CONFIGURATION == {
+        "enable_cache": False,
+        "extra": {"key": "value"},
+    }
+
+    init = mocker.patch.object(BaseStep, "__init__", return_value=None)
+    s(name="custom_name")
+    init.assert_called_once_with(
+        enable_cache=False, extra={"key": "value"}, name="custom_name"
+    )
+
+
 def test_step_configuration(empty_step):
     """Tests the step configuration and overwriting/merging with existing
     configurations."""